@@ -21,20 +21,29 @@ addresses.
 #
 # SPDX-License-Identifier: MIT
 
-from . import atlus, resources
-from .atlus import (
-    abbrs,
-    get_address,
-    get_phone,
-    get_title,
-    mc_replace,
-    ord_replace,
-    remove_br_unicode,
-    us_replace,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import atlus, objects, resources
+    from .atlus import (
+        AddressRecord,
+        abbrs,
+        get_address,
+        get_address_records,
+        get_addresses,
+        get_phone,
+        get_title,
+        mc_replace,
+        ord_replace,
+        remove_br_unicode,
+        us_replace,
+    )
 
 __all__ = [
+    "AddressRecord",
     "get_address",
+    "get_address_records",
+    "get_addresses",
     "get_phone",
     "abbrs",
     "get_title",
@@ -43,5 +52,19 @@ __all__ = [
     "ord_replace",
     "remove_br_unicode",
     "atlus",
+    "objects",
     "resources",
 ]
+
+
+def __getattr__(name: str):
+    """Import the heavy parsing stack lazily on first attribute access."""
+    if name in ("atlus", "objects", "resources"):
+        import importlib
+
+        return importlib.import_module(f".{name}", __name__)
+    if name in __all__:
+        from . import atlus as _atlus
+
+        return getattr(_atlus, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
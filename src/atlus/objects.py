@@ -1,48 +1,335 @@
 """Define objects for parsing fields."""
 
-from typing import Optional, Union
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, List, Optional, TypedDict
 
-from pydantic import BaseModel, Field
+from .resources import _compile, state_codes
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
-class Address(BaseModel):
-    """Define address parsing fields."""
+# both patterns are matched with fullmatch, so they carry no anchors and
+# compile identically under re2 and regex
+state_comp = _compile(r"[A-Z]{2}")
+"""Valid `addr:state` values."""
 
-    addr_housenumber: Optional[Union[int, str]] = Field(
-        alias="addr:housenumber",
-        description="The house number that is included in the address.",
-        examples=[200, "1200-29"],
-        default=None,
-    )
-    addr_street: Optional[str] = Field(
-        alias="addr:street",
-        description="The street that the address is located on.",
-        examples=["North Spring Street"],
-        default=None,
-    )
-    addr_unit: Optional[str] = Field(
-        alias="addr:unit",
-        description="The unit number or letter that is included in the address.",
-        examples=["B"],
-        default=None,
+postcode_comp = _compile(r"\d{5}(?:-\d{4})?")
+"""Valid `addr:postcode` values."""
+
+osm_keys = tuple(
+    sys.intern(key)
+    for key in (
+        "addr:housenumber",
+        "addr:street",
+        "addr:unit",
+        "addr:city",
+        "addr:state",
+        "addr:postcode",
     )
-    addr_city: Optional[str] = Field(
-        alias="addr:city",
-        description="The city that the address is located in.",
-        examples=["Los Angeles"],
-        default=None,
+)
+"""Canonical OSM address keys, interned so produced dicts share one copy."""
+
+attr_to_alias = {sys.intern(alias.replace(":", "_")): alias for alias in osm_keys}
+"""Map model attribute names to their `addr:` aliases, computed once."""
+
+alias_to_attr = {alias: name for name, alias in attr_to_alias.items()}
+"""Map `addr:` aliases back to model attribute names."""
+
+AddressDict = TypedDict(
+    "AddressDict",
+    {
+        "addr:housenumber": str,
+        "addr:street": str,
+        "addr:unit": str,
+        "addr:city": str,
+        "addr:state": str,
+        "addr:postcode": str,
+    },
+    total=False,
+)
+"""Plain-dict shape of a parsed address, keyed by OSM tag."""
+
+
+def validate_address(address: AddressDict) -> AddressDict:
+    """Validate a plain address dict without building a model instance.
+
+    Checks `addr:state` and `addr:postcode` against the same precompiled
+    patterns the `Address` model uses, raising `ValueError` on mismatch.
+
+    Args:
+        address (AddressDict): parsed address keyed by OSM tag.
+
+    Returns:
+        AddressDict: the validated input, unchanged.
+    """
+    for key, pattern in (("addr:state", state_comp), ("addr:postcode", postcode_comp)):
+        value = address.get(key)
+        if value is not None and not pattern.fullmatch(value):
+            raise ValueError(
+                f"{key} should match pattern '{pattern.pattern}': {value!r}"
+            )
+    return address
+
+
+@dataclass(frozen=True)
+class FastAddress:
+    """Slim dataclass variant of `Address` for bulk parsing workloads.
+
+    Runs only the two regex checks in `__post_init__` instead of a full
+    pydantic validator graph, raising `ValueError` on mismatch.
+    """
+
+    addr_housenumber: Optional[str] = None
+    addr_street: Optional[str] = None
+    addr_unit: Optional[str] = None
+    addr_city: Optional[str] = None
+    addr_state: Optional[str] = None
+    addr_postcode: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Check state and postcode against the shared patterns."""
+        if self.addr_state is not None and not state_comp.fullmatch(self.addr_state):
+            raise ValueError(f"invalid addr:state: {self.addr_state!r}")
+        if self.addr_postcode is not None and not postcode_comp.fullmatch(
+            self.addr_postcode
+        ):
+            raise ValueError(f"invalid addr:postcode: {self.addr_postcode!r}")
+
+    @classmethod
+    def from_dict(cls, address: AddressDict) -> "FastAddress":
+        """Build from an alias-keyed dict."""
+        return cls(
+            **{name: address.get(alias) for name, alias in attr_to_alias.items()}
+        )
+
+    def to_dict(self) -> AddressDict:
+        """Dump non-`None` fields keyed by OSM tag."""
+        return {
+            alias: value
+            for name, alias in attr_to_alias.items()
+            if (value := getattr(self, name)) is not None
+        }
+
+
+@lru_cache(maxsize=1)
+def _build_address_model() -> "type[BaseModel]":
+    """Build the pydantic `Address` model on first use.
+
+    Importing pydantic and constructing the model's core schema is the
+    expensive part of this module; deferring it keeps `atlus.objects`
+    cheap for callers that only need the patterns or alias maps.
+
+    Returns:
+        type[BaseModel]: the `Address` model class.
+    """
+    from pydantic import (
+        BaseModel,
+        ConfigDict,
+        Field,
+        StringConstraints,
+        field_validator,
     )
-    addr_state: Optional[str] = Field(
-        alias="addr:state",
-        pattern=r"^[A-Z]{2}$",
-        description="The state or territory of the address.",
-        examples=["CA"],
-        default=None,
+    from typing_extensions import Annotated
+
+    # pydantic-core compiles these with the Rust regex crate, which spells
+    # the end-of-string anchor \z rather than Python's \Z
+    state = Annotated[
+        str, StringConstraints(min_length=2, max_length=2, pattern=r"\A[A-Z]{2}\z")
+    ]
+    postcode = Annotated[
+        str,
+        StringConstraints(min_length=5, max_length=10, pattern=r"\A\d{5}(?:-\d{4})?\z"),
+    ]
+
+    class Address(BaseModel):
+        """Define address parsing fields."""
+
+        model_config = ConfigDict(
+            populate_by_name=True,
+            extra="ignore",
+            frozen=True,
+            validate_assignment=False,
+        )
+
+        addr_housenumber: Optional[str] = Field(
+            alias="addr:housenumber",
+            description="The house number that is included in the address.",
+            examples=["200", "1200-29"],
+            default=None,
+        )
+        addr_street: Optional[str] = Field(
+            alias="addr:street",
+            description="The street that the address is located on.",
+            examples=["North Spring Street"],
+            default=None,
+        )
+        addr_unit: Optional[str] = Field(
+            alias="addr:unit",
+            description="The unit number or letter that is included in the address.",
+            examples=["B"],
+            default=None,
+        )
+        addr_city: Optional[str] = Field(
+            alias="addr:city",
+            description="The city that the address is located in.",
+            examples=["Los Angeles"],
+            default=None,
+        )
+        addr_state: Optional[state] = Field(
+            alias="addr:state",
+            description="The state or territory of the address.",
+            examples=["CA"],
+            default=None,
+        )
+        addr_postcode: Optional[postcode] = Field(
+            alias="addr:postcode",
+            description="The postal code of the address.",
+            examples=["90012", "90012-4801"],
+            default=None,
+        )
+
+        @classmethod
+        def _from_positional(
+            cls,
+            housenumber: Optional[str] = None,
+            street: Optional[str] = None,
+            unit: Optional[str] = None,
+            city: Optional[str] = None,
+            state: Optional[str] = None,
+            postcode: Optional[str] = None,
+        ) -> "Address":
+            """Construct from trusted positional values, skipping validation.
+
+            Only the two regex checks run; intended for values produced by
+            atlus's own parser.
+            """
+            if state is not None and not state_comp.fullmatch(state):
+                raise ValueError(f"invalid addr:state: {state!r}")
+            if postcode is not None and not postcode_comp.fullmatch(postcode):
+                raise ValueError(f"invalid addr:postcode: {postcode!r}")
+            return cls.model_construct(
+                addr_housenumber=housenumber,
+                addr_street=street,
+                addr_unit=unit,
+                addr_city=city,
+                addr_state=state,
+                addr_postcode=postcode,
+            )
+
+        @field_validator("addr_housenumber", mode="before")
+        @classmethod
+        def _coerce_housenumber(cls, value: object) -> object:
+            """Stringify integer house numbers before validation."""
+            return str(value) if isinstance(value, int) else value
+
+        def fast_dump(self) -> dict:
+            """Dump all fields keyed by alias, bypassing the generic dump path."""
+            values = self.__dict__
+            return {alias: values[name] for name, alias in attr_to_alias.items()}
+
+    return Address
+
+
+def __getattr__(name: str):
+    """Build the `Address` model lazily on first attribute access."""
+    if name == "Address":
+        return _build_address_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def address_json_schema() -> dict:
+    """Return the `Address` JSON schema, built once and cached."""
+    return _build_address_model().model_json_schema()
+
+
+def is_state(value: str) -> bool:
+    """Check a value against the assigned USPS state, territory, and province codes.
+
+    Stricter than the two-letter regex, which admits codes like `ZZ`
+    that no state uses; membership in the frozen code set is O(1).
+
+    Args:
+        value (str): state code to check.
+
+    Returns:
+        bool: whether the value is an assigned code.
+    """
+    return value in state_codes
+
+
+def is_postcode(value: str) -> bool:
+    """Check a postcode's fixed shape without invoking the regex engine.
+
+    The pattern only admits two shapes — five digits, or five digits,
+    a hyphen, and four digits — so a length check plus `str.isdigit`
+    answers it in straight-line Python.
+
+    Args:
+        value (str): postal code to check.
+
+    Returns:
+        bool: whether the value is a valid postcode.
+    """
+    length = len(value)
+    if length == 5:
+        return value.isdigit()
+    return (
+        length == 10 and value[5] == "-" and value[:5].isdigit() and value[6:].isdigit()
     )
-    addr_postcode: Optional[str] = Field(
-        alias="addr:postcode",
-        pattern=r"^\d{5}(?:\-\d{4})?$",
-        description="The postal code of the address.",
-        examples=["90012", "90012-4801"],
-        default=None,
+
+
+def validate_postcodes(postcodes: Iterable[str]) -> List[bool]:
+    """Validate a batch of postcodes in one pass.
+
+    Binds the compiled pattern's `fullmatch` once so per-item cost is a
+    single call, for bulk workloads over large columns of codes.
+
+    Args:
+        postcodes (Iterable[str]): postal codes to check.
+
+    Returns:
+        List[bool]: validity flag for each input, in order.
+    """
+    fullmatch = postcode_comp.fullmatch
+    return [fullmatch(code) is not None for code in postcodes]
+
+
+def to_osm_dict(address: "BaseModel") -> AddressDict:
+    """Dump an `Address` to an alias-keyed dict without pydantic serialization.
+
+    Args:
+        address (Address): the model instance to dump.
+
+    Returns:
+        AddressDict: non-`None` fields keyed by OSM tag.
+    """
+    return {
+        alias: value
+        for name, alias in attr_to_alias.items()
+        if (value := getattr(address, name)) is not None
+    }
+
+
+def from_osm_dict(address: AddressDict) -> "BaseModel":
+    """Build an `Address` from an alias-keyed dict, skipping model validation.
+
+    The dict is checked with `validate_address` first, so the two regex
+    constraints still hold.
+
+    Args:
+        address (AddressDict): parsed address keyed by OSM tag.
+
+    Returns:
+        Address: the constructed model instance.
+    """
+    validate_address(address)
+    return _build_address_model().model_construct(
+        **{
+            name: value
+            for alias, name in alias_to_attr.items()
+            if (value := address.get(alias)) is not None
+        }
     )
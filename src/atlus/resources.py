@@ -1,357 +1,425 @@
 """Hold info for the processing script."""
 
+import sys
+from types import MappingProxyType
+
 import regex
 
-direction_expand = {
-    "NE": "Northeast",
-    "SE": "Southeast",
-    "NW": "Northwest",
-    "SW": "Southwest",
-    "N": "North",
-    "E": "East",
-    "S": "South",
-    "W": "West",
-}
+try:
+    import re2
+except ImportError:
+    re2 = None
+else:
+    try:
+        # probe the re-style surface the callers rely on: int flags,
+        # fullmatch, and named groups; google-re2's Options-based binding
+        # lacks parts of it and falls back cleanly
+        if re2.compile("(?P<probe>a)", 0).fullmatch("a").lastgroup != "probe":
+            re2 = None
+    except Exception:
+        re2 = None
+
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile a pattern through `re2` when available, falling back to `regex`.
+
+    `re2` matches with a linear-time DFA, which is faster on the
+    alternation-heavy patterns below; patterns it rejects (lookarounds,
+    variable-length lookbehinds) silently fall back to `regex`.
+
+    Args:
+        pattern (str): Pattern to compile.
+        flags (int): Flags to pass to the compiler.
+
+    Returns:
+        Compiled pattern object.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, flags)
+        except (re2.error, TypeError, ValueError):
+            pass
+    return regex.compile(pattern, flags=flags)
+
+
+def _intern_frozen(mapping: dict) -> MappingProxyType:
+    """Freeze a lookup table, interning its values.
+
+    The expansion values recur in millions of output strings; interning
+    lets every lookup hand back the same object.
+
+    Args:
+        mapping (dict): Table to freeze.
+
+    Returns:
+        MappingProxyType: Read-only view with interned values.
+    """
+    return MappingProxyType({key: sys.intern(value) for key, value in mapping.items()})
+
+
+direction_expand = _intern_frozen(
+    {
+        "NE": "Northeast",
+        "SE": "Southeast",
+        "NW": "Northwest",
+        "SW": "Southwest",
+        "N": "North",
+        "E": "East",
+        "S": "South",
+        "W": "West",
+    }
+)
 """Compass direction abbreviations."""
 
-name_expand = {
-    "ARPT": "airport",
-    "BLDG": "building",
-    "CONF": "conference",
-    "CONV": "convention",
-    "CNTR": "center",
-    "CTR": "center",
-    "DWTN": "downtown",
-    "INTL": "international",
-    "FT": "fort",
-    "MT": "mount",
-    "MTN": "mountain",
-    "SHPG": "shopping",
-}
+name_expand = _intern_frozen(
+    {
+        "ARPT": "airport",
+        "BLDG": "building",
+        "CONF": "conference",
+        "CONV": "convention",
+        "CNTR": "center",
+        "CTR": "center",
+        "DWTN": "downtown",
+        "INTL": "international",
+        "FT": "fort",
+        "MT": "mount",
+        "MTN": "mountain",
+        "SHPG": "shopping",
+    }
+)
 """Common name abbreviations."""
 
-state_expand = {
-    "ALABAMA": "AL",
-    "ALA": "AL",
-    "ALASKA": "AK",
-    "ALAS": "AK",
-    "ARIZONA": "AZ",
-    "ARIZ": "AZ",
-    "ARKANSAS": "AR",
-    "ARK": "AR",
-    "CALIFORNIA": "CA",
-    "CALIF": "CA",
-    "CAL": "CA",
-    "COLORADO": "CO",
-    "COLO": "CO",
-    "COL": "CO",
-    "CONNECTICUT": "CT",
-    "CONN": "CT",
-    "DELAWARE": "DE",
-    "DEL": "DE",
-    "DISTRICT OF COLUMBIA": "DC",
-    "FLORIDA": "FL",
-    "FLA": "FL",
-    "FLOR": "FL",
-    "GEORGIA": "GA",
-    "GA": "GA",
-    "HAWAII": "HI",
-    "IDAHO": "ID",
-    "IDA": "ID",
-    "ILLINOIS": "IL",
-    "ILL": "IL",
-    "INDIANA": "IN",
-    "IND": "IN",
-    "IOWA": "IA",
-    "KANSAS": "KS",
-    "KANS": "KS",
-    "KAN": "KS",
-    "KENTUCKY": "KY",
-    "KEN": "KY",
-    "KENT": "KY",
-    "LOUISIANA": "LA",
-    "MAINE": "ME",
-    "MARYLAND": "MD",
-    "MASSACHUSETTS": "MA",
-    "MASS": "MA",
-    "MICHIGAN": "MI",
-    "MICH": "MI",
-    "MINNESOTA": "MN",
-    "MINN": "MN",
-    "MISSISSIPPI": "MS",
-    "MISS": "MS",
-    "MISSOURI": "MO",
-    "MONTANA": "MT",
-    "MONT": "MT",
-    "NEBRASKA": "NE",
-    "NEBR": "NE",
-    "NEB": "NE",
-    "NEVADA": "NV",
-    "NEV": "NV",
-    "NEW HAMPSHIRE": "NH",
-    "NEW JERSEY": "NJ",
-    "NEW MEXICO": "NM",
-    "N MEX": "NM",
-    "NEW M": "NM",
-    "NEW YORK": "NY",
-    "NORTH CAROLINA": "NC",
-    "NORTH DAKOTA": "ND",
-    "N DAK": "ND",
-    "OHIO": "OH",
-    "OKLAHOMA": "OK",
-    "OKLA": "OK",
-    "OREGON": "OR",
-    "OREG": "OR",
-    "ORE": "OR",
-    "PENNSYLVANIA": "PA",
-    "PENN": "PA",
-    "RHODE ISLAND": "RI",
-    "SOUTH CAROLINA": "SC",
-    "SOUTH DAKOTA": "SD",
-    "S DAK": "SD",
-    "TENNESSEE": "TN",
-    "TENN": "TN",
-    "TEXAS": "TX",
-    "TEX": "TX",
-    "UTAH": "UT",
-    "VERMONT": "VT",
-    "VIRGINIA": "VA",
-    "WASHINGTON": "WA",
-    "WASH": "WA",
-    "WEST VIRGINIA": "WV",
-    "W VA": "WV",
-    "WISCONSIN": "WI",
-    "WIS": "WI",
-    "WISC": "WI",
-    "WYOMING": "WY",
-    "WYO": "WY",
-    "ONTARIO": "ON",
-    "QUEBEC": "QC",
-    "NOVA SCOTIA": "NS",
-    "NEW BRUNSWICK": "NB",
-    "MANITOBA": "MB",
-    "BRITISH COLUMBIA": "BC",
-    "PRINCE EDWARD ISLAND": "PE",
-    "PRINCE EDWARD": "PE",
-    "SASKATCHEWAN": "SK",
-    "ALBERTA": "AB",
-    "NEWFOUNDLAND AND LABRADOR": "NL",
-    "NEWFOUNDLAND & LABRADOR": "NL",
-    "NEWFOUNDLAND": "NL",
-    "YUKON": "YK",
-    "NUNAVUT": "NU",
-    "NORTHWEST TERRITORIES": "NT",
-    "NW TERRITORIES": "NT",
-}
+state_expand = _intern_frozen(
+    {
+        "ALABAMA": "AL",
+        "ALA": "AL",
+        "ALASKA": "AK",
+        "ALAS": "AK",
+        "ARIZONA": "AZ",
+        "ARIZ": "AZ",
+        "ARKANSAS": "AR",
+        "ARK": "AR",
+        "CALIFORNIA": "CA",
+        "CALIF": "CA",
+        "CAL": "CA",
+        "COLORADO": "CO",
+        "COLO": "CO",
+        "COL": "CO",
+        "CONNECTICUT": "CT",
+        "CONN": "CT",
+        "DELAWARE": "DE",
+        "DEL": "DE",
+        "DISTRICT OF COLUMBIA": "DC",
+        "FLORIDA": "FL",
+        "FLA": "FL",
+        "FLOR": "FL",
+        "GEORGIA": "GA",
+        "GA": "GA",
+        "HAWAII": "HI",
+        "IDAHO": "ID",
+        "IDA": "ID",
+        "ILLINOIS": "IL",
+        "ILL": "IL",
+        "INDIANA": "IN",
+        "IND": "IN",
+        "IOWA": "IA",
+        "KANSAS": "KS",
+        "KANS": "KS",
+        "KAN": "KS",
+        "KENTUCKY": "KY",
+        "KEN": "KY",
+        "KENT": "KY",
+        "LOUISIANA": "LA",
+        "MAINE": "ME",
+        "MARYLAND": "MD",
+        "MASSACHUSETTS": "MA",
+        "MASS": "MA",
+        "MICHIGAN": "MI",
+        "MICH": "MI",
+        "MINNESOTA": "MN",
+        "MINN": "MN",
+        "MISSISSIPPI": "MS",
+        "MISS": "MS",
+        "MISSOURI": "MO",
+        "MONTANA": "MT",
+        "MONT": "MT",
+        "NEBRASKA": "NE",
+        "NEBR": "NE",
+        "NEB": "NE",
+        "NEVADA": "NV",
+        "NEV": "NV",
+        "NEW HAMPSHIRE": "NH",
+        "NEW JERSEY": "NJ",
+        "NEW MEXICO": "NM",
+        "N MEX": "NM",
+        "NEW M": "NM",
+        "NEW YORK": "NY",
+        "NORTH CAROLINA": "NC",
+        "NORTH DAKOTA": "ND",
+        "N DAK": "ND",
+        "OHIO": "OH",
+        "OKLAHOMA": "OK",
+        "OKLA": "OK",
+        "OREGON": "OR",
+        "OREG": "OR",
+        "ORE": "OR",
+        "PENNSYLVANIA": "PA",
+        "PENN": "PA",
+        "RHODE ISLAND": "RI",
+        "SOUTH CAROLINA": "SC",
+        "SOUTH DAKOTA": "SD",
+        "S DAK": "SD",
+        "TENNESSEE": "TN",
+        "TENN": "TN",
+        "TEXAS": "TX",
+        "TEX": "TX",
+        "UTAH": "UT",
+        "VERMONT": "VT",
+        "VIRGINIA": "VA",
+        "WASHINGTON": "WA",
+        "WASH": "WA",
+        "WEST VIRGINIA": "WV",
+        "W VA": "WV",
+        "WISCONSIN": "WI",
+        "WIS": "WI",
+        "WISC": "WI",
+        "WYOMING": "WY",
+        "WYO": "WY",
+        "ONTARIO": "ON",
+        "QUEBEC": "QC",
+        "NOVA SCOTIA": "NS",
+        "NEW BRUNSWICK": "NB",
+        "MANITOBA": "MB",
+        "BRITISH COLUMBIA": "BC",
+        "PRINCE EDWARD ISLAND": "PE",
+        "PRINCE EDWARD": "PE",
+        "SASKATCHEWAN": "SK",
+        "ALBERTA": "AB",
+        "NEWFOUNDLAND AND LABRADOR": "NL",
+        "NEWFOUNDLAND & LABRADOR": "NL",
+        "NEWFOUNDLAND": "NL",
+        "YUKON": "YT",
+        "NUNAVUT": "NU",
+        "NORTHWEST TERRITORIES": "NT",
+        "NW TERRITORIES": "NT",
+    }
+)
 """Map states to abbreviations."""
 
-street_expand = {
-    "ACC": "ACCESS",
-    "ALY": "ALLEY",
-    "ANX": "ANEX",
-    "ARC": "ARCADE",
-    "AV": "AVENUE",
-    "AVE": "AVENUE",
-    "BYU": "BAYOU",
-    "BCH": "BEACH",
-    "BND": "BEND",
-    "BLF": "BLUFF",
-    "BLFS": "BLUFFS",
-    "BTM": "BOTTOM",
-    "BLVD": "BOULEVARD",
-    "BR": "BRANCH",
-    "BRG": "BRIDGE",
-    "BRK": "BROOK",
-    "BRKS": "BROOKS",
-    "BG": "BURG",
-    "BGS": "BURGS",
-    "BYP": "BYPASS",
-    "CP": "CAMP",
-    "CY": "KEY",
-    "CYN": "CANYON",
-    "CPE": "CAPE",
-    "CTR": "CENTER",
-    "CTRS": "CENTERS",
-    "CIR": "CIRCLE",
-    "CIRS": "CIRCLES",
-    "CLF": "CLIFF",
-    "CLFS": "CLIFFS",
-    "CLB": "CLUB",
-    "CMN": "COMMON",
-    "CMNS": "COMMONS",
-    "COR": "CORNER",
-    "CORS": "CORNERS",
-    "CRSE": "COURSE",
-    "CT": "COURT",
-    "CTS": "COURTS",
-    "CV": "COVE",
-    "CVS": "COVES",
-    "CRK": "CREEK",
-    "CRES": "CRESCENT",
-    "CRST": "CREST",
-    "CSWY": "CAUSEWAY",
-    "CURV": "CURVE",
-    "DL": "DALE",
-    "DM": "DAM",
-    "DV": "DIVIDE",
-    "DR": "DRIVE",
-    "DRS": "DRIVES",
-    "EST": "ESTATE",
-    "EXPY": "EXPRESSWAY",
-    "EXPWY": "EXPRESSWAY",
-    "EXT": "EXTENSION",
-    "EXTS": "EXTENSIONS",
-    "FGR": "FORGE",
-    "FGRS": "FORGES",
-    "FLS": "FALLS",
-    "FLD": "FIELD",
-    "FLDS": "FIELDS",
-    "FLT": "FLAT",
-    "FLTS": "FLATS",
-    "FRD": "FORD",
-    "FRDS": "FORDS",
-    "FRST": "FOREST",
-    "FRG": "FORGE",
-    "FRGS": "FORGES",
-    "FRK": "FORK",
-    "FRKS": "FORKS",
-    "FRY": "FERRY",
-    "FRYS": "FERRYS",
-    "FOR": "FORD",
-    "FORS": "FORDS",
-    "FT": "FORT",
-    "FWY": "FREEWAY",
-    "GD": "GRADE",
-    "GDN": "GARDEN",
-    "GDNS": "GARDENS",
-    "GTWY": "GATEWAY",
-    "GLN": "GLEN",
-    "GLNS": "GLENS",
-    "GN": "GREEN",
-    "GNS": "GREENS",
-    "GRN": "GREEN",
-    "GRNS": "GREENS",
-    "GRV": "GROVE",
-    "GRVS": "GROVES",
-    "HBR": "HARBOR",
-    "HBRS": "HARBORS",
-    "HGWY": "HIGHWAY",
-    "HVN": "HAVEN",
-    "HTS": "HEIGHTS",
-    "HWY": "HIGHWAY",
-    "HL": "HILL",
-    "HLS": "HILLS",
-    "HOLW": "HOLLOW",
-    "INLT": "INLET",
-    "IS": "ISLAND",
-    "ISS": "ISLANDS",
-    "JCT": "JUNCTION",
-    "JCTS": "JUNCTIONS",
-    "KY": "KEY",
-    "KYS": "KEYS",
-    "KNL": "KNOLL",
-    "KNLS": "KNOLLS",
-    "LK": "LAKE",
-    "LKS": "LAKES",
-    "LNDG": "LANDING",
-    "LN": "LANE",
-    "LGT": "LIGHT",
-    "LGTS": "LIGHTS",
-    "LF": "LOAF",
-    "LCK": "LOCK",
-    "LCKS": "LOCKS",
-    "LDG": "LODGE",
-    "LP": "LOOP",
-    "MNR": "MANOR",
-    "MNRS": "MANORS",
-    "MDW": "MEADOW",
-    "MDWS": "MEADOWS",
-    "ML": "MILL",
-    "MLS": "MILLS",
-    "MSN": "MISSION",
-    "MTWY": "MOTORWAY",
-    "MT": "MOUNT",
-    "MTN": "MOUNTAIN",
-    "MTNS": "MOUNTAINS",
-    "NCK": "NECK",
-    "ORCH": "ORCHARD",
-    "OPAS": "OVERPASS",
-    "PKY": "PARKWAY",
-    "PKWY": "PARKWAY",
-    "PSGE": "PASSAGE",
-    "PNE": "PINE",
-    "PNES": "PINES",
-    "PL": "PLACE",
-    "PLN": "PLAIN",
-    "PLNS": "PLAINS",
-    "PLZ": "PLAZA",
-    "PT": "POINT",
-    "PTS": "POINTS",
-    "PRT": "PORT",
-    "PRTS": "PORTS",
-    "PR": "PRAIRIE",
-    "PVT": "PRIVATE",
-    "RADL": "RADIAL",
-    "RNCH": "RANCH",
-    "RPD": "RAPID",
-    "RPDS": "RAPIDS",
-    "RST": "REST",
-    "RDG": "RIDGE",
-    "RDGS": "RIDGES",
-    "RIV": "RIVER",
-    "RD": "ROAD",
-    "RDS": "ROADS",
-    "RT": "ROUTE",
-    "RTE": "ROUTE",
-    "SHL": "SHOAL",
-    "SHLS": "SHOALS",
-    "SHR": "SHORE",
-    "SHRS": "SHORES",
-    "SKWY": "SKYWAY",
-    "SPG": "SPRING",
-    "SPGS": "SPRINGS",
-    "SQ": "SQUARE",
-    "SQS": "SQUARES",
-    "STA": "STATION",
-    "STRA": "STRAVENUE",
-    "STRM": "STREAM",
-    "STS": "STREETS",
-    "SMT": "SUMMIT",
-    "SRVC": "SERVICE",
-    "TER": "TERRACE",
-    "TRWY": "THROUGHWAY",
-    "THFR": "THOROUGHFARE",
-    "TRCE": "TRACE",
-    "TRAK": "TRACK",
-    "TRFY": "TRAFFICWAY",
-    "TRL": "TRAIL",
-    "TRLR": "TRAILER",
-    "TUNL": "TUNNEL",
-    "TPKE": "TURNPIKE",
-    "UPAS": "UNDERPASS",
-    "UN": "UNION",
-    "UNP": "UNDERPASS",
-    "UNS": "UNIONS",
-    "VIA": "VIADUCT",
-    "VIAS": "VIADUCTS",
-    "VLY": "VALLEY",
-    "VLYS": "VALLEYS",
-    "VW": "VIEW",
-    "VWS": "VIEWS",
-    "VLG": "VILLAGE",
-    "VL": "VILLE",
-    "VIS": "VISTA",
-    "WK": "WALK",
-    "WKWY": "WALKWAY",
-    "WY": "WAY",
-    "WL": "WELL",
-    "WLS": "WELLS",
-    "XING": "CROSSING",
-    "XINGS": "CROSSINGS",
-    "XRD": "CROSSROAD",
-    "XRDS": "CROSSROADS",
-    "YU": "BAYOU",
-}
+state_codes = frozenset(state_expand.values()) | frozenset(
+    ("PR", "VI", "GU", "AS", "MP", "AA", "AE", "AP")
+)
+"""Valid state, territory, military, and province abbreviations."""
+
+street_expand = _intern_frozen(
+    {
+        "ACC": "ACCESS",
+        "ALY": "ALLEY",
+        "ANX": "ANEX",
+        "ARC": "ARCADE",
+        "AV": "AVENUE",
+        "AVE": "AVENUE",
+        "BYU": "BAYOU",
+        "BCH": "BEACH",
+        "BND": "BEND",
+        "BLF": "BLUFF",
+        "BLFS": "BLUFFS",
+        "BTM": "BOTTOM",
+        "BLVD": "BOULEVARD",
+        "BR": "BRANCH",
+        "BRG": "BRIDGE",
+        "BRK": "BROOK",
+        "BRKS": "BROOKS",
+        "BG": "BURG",
+        "BGS": "BURGS",
+        "BYP": "BYPASS",
+        "CP": "CAMP",
+        "CY": "KEY",
+        "CYN": "CANYON",
+        "CPE": "CAPE",
+        "CTR": "CENTER",
+        "CTRS": "CENTERS",
+        "CIR": "CIRCLE",
+        "CIRS": "CIRCLES",
+        "CLF": "CLIFF",
+        "CLFS": "CLIFFS",
+        "CLB": "CLUB",
+        "CMN": "COMMON",
+        "CMNS": "COMMONS",
+        "COR": "CORNER",
+        "CORS": "CORNERS",
+        "CRSE": "COURSE",
+        "CT": "COURT",
+        "CTS": "COURTS",
+        "CV": "COVE",
+        "CVS": "COVES",
+        "CRK": "CREEK",
+        "CRES": "CRESCENT",
+        "CRST": "CREST",
+        "CSWY": "CAUSEWAY",
+        "CURV": "CURVE",
+        "DL": "DALE",
+        "DM": "DAM",
+        "DV": "DIVIDE",
+        "DR": "DRIVE",
+        "DRS": "DRIVES",
+        "EST": "ESTATE",
+        "EXPY": "EXPRESSWAY",
+        "EXPWY": "EXPRESSWAY",
+        "EXT": "EXTENSION",
+        "EXTS": "EXTENSIONS",
+        "FGR": "FORGE",
+        "FGRS": "FORGES",
+        "FLS": "FALLS",
+        "FLD": "FIELD",
+        "FLDS": "FIELDS",
+        "FLT": "FLAT",
+        "FLTS": "FLATS",
+        "FRD": "FORD",
+        "FRDS": "FORDS",
+        "FRST": "FOREST",
+        "FRG": "FORGE",
+        "FRGS": "FORGES",
+        "FRK": "FORK",
+        "FRKS": "FORKS",
+        "FRY": "FERRY",
+        "FRYS": "FERRYS",
+        "FOR": "FORD",
+        "FORS": "FORDS",
+        "FT": "FORT",
+        "FWY": "FREEWAY",
+        "GD": "GRADE",
+        "GDN": "GARDEN",
+        "GDNS": "GARDENS",
+        "GTWY": "GATEWAY",
+        "GLN": "GLEN",
+        "GLNS": "GLENS",
+        "GN": "GREEN",
+        "GNS": "GREENS",
+        "GRN": "GREEN",
+        "GRNS": "GREENS",
+        "GRV": "GROVE",
+        "GRVS": "GROVES",
+        "HBR": "HARBOR",
+        "HBRS": "HARBORS",
+        "HGWY": "HIGHWAY",
+        "HVN": "HAVEN",
+        "HTS": "HEIGHTS",
+        "HWY": "HIGHWAY",
+        "HL": "HILL",
+        "HLS": "HILLS",
+        "HOLW": "HOLLOW",
+        "INLT": "INLET",
+        "IS": "ISLAND",
+        "ISS": "ISLANDS",
+        "JCT": "JUNCTION",
+        "JCTS": "JUNCTIONS",
+        "KY": "KEY",
+        "KYS": "KEYS",
+        "KNL": "KNOLL",
+        "KNLS": "KNOLLS",
+        "LK": "LAKE",
+        "LKS": "LAKES",
+        "LNDG": "LANDING",
+        "LN": "LANE",
+        "LGT": "LIGHT",
+        "LGTS": "LIGHTS",
+        "LF": "LOAF",
+        "LCK": "LOCK",
+        "LCKS": "LOCKS",
+        "LDG": "LODGE",
+        "LP": "LOOP",
+        "MNR": "MANOR",
+        "MNRS": "MANORS",
+        "MDW": "MEADOW",
+        "MDWS": "MEADOWS",
+        "ML": "MILL",
+        "MLS": "MILLS",
+        "MSN": "MISSION",
+        "MTWY": "MOTORWAY",
+        "MT": "MOUNT",
+        "MTN": "MOUNTAIN",
+        "MTNS": "MOUNTAINS",
+        "NCK": "NECK",
+        "ORCH": "ORCHARD",
+        "OPAS": "OVERPASS",
+        "PKY": "PARKWAY",
+        "PKWY": "PARKWAY",
+        "PSGE": "PASSAGE",
+        "PNE": "PINE",
+        "PNES": "PINES",
+        "PL": "PLACE",
+        "PLN": "PLAIN",
+        "PLNS": "PLAINS",
+        "PLZ": "PLAZA",
+        "PT": "POINT",
+        "PTS": "POINTS",
+        "PRT": "PORT",
+        "PRTS": "PORTS",
+        "PR": "PRAIRIE",
+        "PVT": "PRIVATE",
+        "RADL": "RADIAL",
+        "RNCH": "RANCH",
+        "RPD": "RAPID",
+        "RPDS": "RAPIDS",
+        "RST": "REST",
+        "RDG": "RIDGE",
+        "RDGS": "RIDGES",
+        "RIV": "RIVER",
+        "RD": "ROAD",
+        "RDS": "ROADS",
+        "RT": "ROUTE",
+        "RTE": "ROUTE",
+        "SHL": "SHOAL",
+        "SHLS": "SHOALS",
+        "SHR": "SHORE",
+        "SHRS": "SHORES",
+        "SKWY": "SKYWAY",
+        "SPG": "SPRING",
+        "SPGS": "SPRINGS",
+        "SQ": "SQUARE",
+        "SQS": "SQUARES",
+        "STA": "STATION",
+        "STRA": "STRAVENUE",
+        "STRM": "STREAM",
+        "STS": "STREETS",
+        "SMT": "SUMMIT",
+        "SRVC": "SERVICE",
+        "TER": "TERRACE",
+        "TRWY": "THROUGHWAY",
+        "THFR": "THOROUGHFARE",
+        "TRCE": "TRACE",
+        "TRAK": "TRACK",
+        "TRFY": "TRAFFICWAY",
+        "TRL": "TRAIL",
+        "TRLR": "TRAILER",
+        "TUNL": "TUNNEL",
+        "TPKE": "TURNPIKE",
+        "UPAS": "UNDERPASS",
+        "UN": "UNION",
+        "UNP": "UNDERPASS",
+        "UNS": "UNIONS",
+        "VIA": "VIADUCT",
+        "VIAS": "VIADUCTS",
+        "VLY": "VALLEY",
+        "VLYS": "VALLEYS",
+        "VW": "VIEW",
+        "VWS": "VIEWS",
+        "VLG": "VILLAGE",
+        "VL": "VILLE",
+        "VIS": "VISTA",
+        "WK": "WALK",
+        "WKWY": "WALKWAY",
+        "WY": "WAY",
+        "WL": "WELL",
+        "WLS": "WELLS",
+        "XING": "CROSSING",
+        "XINGS": "CROSSINGS",
+        "XRD": "CROSSROAD",
+        "XRDS": "CROSSROADS",
+        "YU": "BAYOU",
+    }
+)
 """Common street type abbreviations."""
 
 saints = [
@@ -484,35 +552,61 @@ bad_zip_first_3 = [
 """Three-digit combinations that don't represent a zip code."""
 
 # pre-compile regex for speed
-ABBR_JOIN = "|".join({**name_expand, **street_expand})
-abbr_join_comp = regex.compile(
-    rf"(\b(?:{ABBR_JOIN})\b\.?)(?!')", flags=regex.IGNORECASE
+cap_expand = MappingProxyType(
+    {"Cr": "CR", "Ch": "CH", "Sr": "SR", "Sh": "SH", "Fm": "FM", "Rm": "RM", "Us": "US"}
 )
+"""Shortened road descriptors mapped to their uppercase forms."""
+
+abbr_expand = MappingProxyType({**name_expand, **street_expand})
+"""Merged name and street type abbreviations."""
+
+abbr_expand_title = _intern_frozen(
+    {abbr: word.title() for abbr, word in abbr_expand.items()}
+)
+"""Merged abbreviations with title-cased expansions."""
+
+ABBR_JOIN = "|".join(abbr_expand)
+abbr_join_comp = _compile(rf"(\b(?:{ABBR_JOIN})\b\.?)(?!')", flags=regex.IGNORECASE)
 
 DIR_FILL = "|".join(r"\.?".join(list(abbr)) for abbr in direction_expand)
 st_ave = r" (?:Street|Avenue)"
-dir_fill_comp = regex.compile(
+dir_fill_comp = _compile(
     rf"(?<!(?:^(?:Avenue) |[\.']))(\b(?:{DIR_FILL})\b\.?)(?!(?:\.?[a-zA-Z]|{st_ave}))",
     flags=regex.IGNORECASE,
 )
 
-sr_comp = regex.compile(r"(\bS\.?R\b\.?)(?= \d+)", flags=regex.IGNORECASE)
+sr_comp = _compile(r"(\bS\.?R\b\.?)(?= \d+)", flags=regex.IGNORECASE)
 
-saint_comp = regex.compile(
+saint_comp = _compile(
     rf"^(St\.?)(?= )|(\bSt\.?)(?= (?:{'|'.join(saints)}))", flags=regex.IGNORECASE
 )
 
-street_comp = regex.compile(
+street_comp = _compile(
     r"St\.?(?= [NESW]\.?[EW]?\.?)|(?<=\d[thndstr]{2} )St\.?\b|St\.?$"
 )
 
-post_comp = regex.compile(r"(\d{5})-?0{4}")
+post_comp = _compile(r"(\d{5})-?0{4}")
 
-usa_comp = regex.compile(r",? (?:USA?|United States(?: of America)?|Canada)\b")
+usa_comp = _compile(r",? (?:USA?|United States(?: of America)?|Canada)\b")
 
-paren_comp = regex.compile(r" ?\(.*\)")
+paren_comp = _compile(r" ?\(.*\)")
+
+# single-scan alternation of the saint/directional/SR/descriptor passes;
+# case-sensitivity of the descriptor branch is preserved with scoped (?i:)
+abbrs_comp = regex.compile(
+    rf"(?P<sr>(?i:\bS\.?R\b\.?(?= \d+)))"
+    rf"|(?P<saint>(?i:^St\.?(?= )|\bSt\.?(?= (?:{'|'.join(saints)}))))"
+    rf"|(?P<dir>(?i:(?<!(?:^(?:Avenue) |[\.']))\b(?:{DIR_FILL})\b\.?"
+    rf"(?!(?:\.?[a-zA-Z]|{st_ave}))))"
+    r"|(?P<cap>\b(?:C[rh]|S[rh]|[FR]m|Us)\b)"
+)
 
 # match Wisconsin grid-style addresses: N65w25055, W249 N6620, etc.
-grid_comp = regex.compile(
-    r"\b([NnSs]\d{2,}\s*[EeWw]\d{2,}|[EeWw]\d{2,}\s*[NnSs]\d{2,})\b"
+grid_comp = _compile(r"\b([NnSs]\d{2,}\s*[EeWw]\d{2,}|[EeWw]\d{2,}\s*[NnSs]\d{2,})\b")
+
+# single-scan alternation of the country, parenthetical, and grid cleanups
+clean_comp = _compile(
+    r",? (?:USA?|United States(?: of America)?|Canada)\b"
+    r"| ?\(.*\)"
+    r"|(?P<grid>\b(?:[NnSs]\d{2,}\s*[EeWw]\d{2,}|[EeWw]\d{2,}\s*[NnSs]\d{2,})\b)"
 )
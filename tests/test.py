@@ -4,7 +4,18 @@
 
 from pydantic import ValidationError
 import pytest
-from src.atlus.objects import Address
+from src.atlus.objects import (
+    Address,
+    FastAddress,
+    address_json_schema,
+    from_osm_dict,
+    is_postcode,
+    is_state,
+    to_osm_dict,
+    validate_address,
+    validate_postcodes,
+)
+from src.atlus.resources import dir_fill_comp
 from src.atlus.atlus import *
 
 
@@ -18,6 +29,7 @@ def test_get_title() -> None:
     assert (
         get_title("MCGREGOR", single_word=True) == "McGregor"
     )  # Test with mock_mc_replace and single_word=True
+    assert get_title("MCDONALD'S PLAZA") == "McDonald's Plaza"
     assert get_title("Some Mixed Case") == "Some Mixed Case"  # No change expected
     assert get_title("MiXeD cAsE") == "MiXeD cAsE"  # No change expected
 
@@ -38,6 +50,7 @@ def test_mc_replace() -> None:
     assert mc_replace("Mcdonald's is popular") == "McDonald's is popular"
     assert mc_replace("I like the Mcflurry") == "I like the McFlurry"
     assert mc_replace("Mcflurry Mcmansion") == "McFlurry McMansion"
+    assert mc_replace("Fort McHENRY") == "Fort McHenry"
     assert (
         mc_replace("No Mc in this string") == "No Mc in this string"
     )  # No change expected
@@ -227,6 +240,83 @@ def test_get_address() -> None:
     }
 
 
+def test_get_address_fast_path() -> None:
+    """Test that the fast path agrees with the usaddress parse"""
+    with_commas = "456 Birch Ave, Lakeside, MN 55014"
+    without_commas = "456 Birch Ave Lakeside MN 55014"
+    assert fast_comp.fullmatch(with_commas) is not None
+    assert fast_comp.fullmatch(without_commas) is None
+    assert get_address(with_commas) == get_address(without_commas)
+    assert get_address(with_commas)[0] == {
+        "addr:housenumber": "456",
+        "addr:street": "Birch Avenue",
+        "addr:city": "Lakeside",
+        "addr:state": "MN",
+        "addr:postcode": "55014",
+    }
+
+
+def test_get_address_fast_path_occupancy() -> None:
+    """Test that streets with occupancy markers skip the fast path"""
+    address = "222 Main St Suite 4, Springfield, IL 62701"
+    assert fast_comp.fullmatch(address) is not None
+    assert occupancy_comp.search("Main St Suite 4") is not None
+    assert get_address(address)[0] == {
+        "addr:housenumber": "222",
+        "addr:street": "Main Street",
+        "addr:unit": "4",
+        "addr:city": "Springfield",
+        "addr:state": "IL",
+        "addr:postcode": "62701",
+    }
+
+
+def test_get_address_fast_path_bailouts() -> None:
+    """Test that occupancy words, fractions, and intersections bail out"""
+    assert occupancy_comp.search("Main St Lot 5") is not None
+    assert get_address("123 Main St Lot 5, Springfield, IL 62701")[0] == {
+        "addr:housenumber": "123",
+        "addr:street": "Main Street",
+        "addr:unit": "5",
+        "addr:city": "Springfield",
+        "addr:state": "IL",
+        "addr:postcode": "62701",
+    }
+    assert occupancy_comp.search("Oak Dr Trlr 7") is not None
+    assert get_address("456 Oak Dr Trlr 7, Springfield, IL 62701")[0] == {
+        "addr:housenumber": "456",
+        "addr:street": "Oak Drive",
+        "addr:unit": "7",
+        "addr:city": "Springfield",
+        "addr:state": "IL",
+        "addr:postcode": "62701",
+    }
+    assert fast_bail_comp.search("1/2 Main St") is not None
+    assert get_address("100 1/2 Main St, Springfield, IL 62701")[0] == {
+        "addr:housenumber": "100 1/2",
+        "addr:street": "Main Street",
+        "addr:city": "Springfield",
+        "addr:state": "IL",
+        "addr:postcode": "62701",
+    }
+    assert fast_bail_comp.search("Main St & 1st Ave") is not None
+    assert fast_bail_comp.search("Main St and 1st Ave") is not None
+
+
+def test_get_address_fast_path_extra_commas() -> None:
+    """Test that extra comma-separated parts fall back to usaddress"""
+    address = "789 Oak Dr, Apt 5, Smallville, KS 66002"
+    assert fast_comp.fullmatch(address) is None
+    assert get_address(address)[0] == {
+        "addr:housenumber": "789",
+        "addr:street": "Oak Drive",
+        "addr:unit": "5",
+        "addr:city": "Smallville",
+        "addr:state": "KS",
+        "addr:postcode": "66002",
+    }
+
+
 def test_get_address_removed_unit() -> None:
     """Test cases for get address"""
     add, removed = get_address(
@@ -276,6 +366,15 @@ def test_invalid_phone_number_3() -> None:
         get_phone("12345")
 
 
+def test_invalid_phone_number_punctuation() -> None:
+    """Test cases for misplaced punctuation with ten digits"""
+    import re
+
+    for bad in ["20+2.900.9019", "202)900(9019", "2.0.2.900.9019", "20-29009-019"]:
+        with pytest.raises(ValueError, match=re.escape(f"Invalid phone number: {bad}")):
+            get_phone(bad)
+
+
 def test_invalid_phone_number_4() -> None:
     """Test cases for blank phone numbers"""
     with pytest.raises(ValueError, match="Invalid phone number: "):
@@ -348,7 +447,7 @@ def test_address_creation_invalid_postcode() -> None:
 def test_address_creation_optional_fields() -> None:
     """Test creation with optional fields missing"""
     address = Address(**{"addr:housenumber": 200, "addr:street": "North Spring Street"})
-    assert address.addr_housenumber == 200
+    assert address.addr_housenumber == "200"
     assert address.addr_street == "North Spring Street"
     assert address.addr_unit is None
     assert address.addr_city is None
@@ -368,9 +467,165 @@ def test_address_alias_handling() -> None:
             "addr:postcode": "90012",
         }
     )
-    assert address.addr_housenumber == 200
+    assert address.addr_housenumber == "200"
     assert address.addr_street == "North Spring Street"
     assert address.addr_unit == "B"
     assert address.addr_city == "Los Angeles"
     assert address.addr_state == "CA"
     assert address.addr_postcode == "90012"
+
+
+def test_get_addresses() -> None:
+    """Test cases for get_addresses"""
+    assert get_addresses(["777 Strawberry St.", "345 Maple Rd"]) == [
+        ({"addr:housenumber": "777", "addr:street": "Strawberry Street"}, []),
+        ({"addr:housenumber": "345", "addr:street": "Maple Road"}, []),
+    ]
+    assert get_addresses([]) == []
+
+
+def test_get_addresses_workers() -> None:
+    """Test that the worker pool path matches the serial path"""
+    addresses = ["777 Strawberry St.", "345 Maple Rd"]
+    assert get_addresses(addresses, workers=2) == get_addresses(addresses)
+
+
+def test_get_address_records() -> None:
+    """Test cases for get_address_records"""
+    records = get_address_records(["345 MAPLE RD, COUNTRYSIDE, PA 24680-0198"])
+    assert records == [
+        AddressRecord(
+            housenumber="345",
+            street="Maple Road",
+            city="Countryside",
+            state="PA",
+            postcode="24680-0198",
+        )
+    ]
+    assert records[0].unit is None
+    assert records[0].removed == ()
+
+
+def test_fast_address() -> None:
+    """Test cases for FastAddress"""
+    address = FastAddress(
+        addr_housenumber="200", addr_state="CA", addr_postcode="90012"
+    )
+    assert address.addr_state == "CA"
+    assert address.to_dict() == {
+        "addr:housenumber": "200",
+        "addr:state": "CA",
+        "addr:postcode": "90012",
+    }
+    assert FastAddress.from_dict(address.to_dict()) == address
+    with pytest.raises(ValueError):
+        FastAddress(addr_state="CAL")
+    with pytest.raises(ValueError):
+        FastAddress(addr_postcode="9001")
+
+
+def test_validate_address() -> None:
+    """Test cases for validate_address"""
+    tags = {"addr:state": "CA", "addr:postcode": "90012"}
+    assert validate_address(tags) is tags
+    with pytest.raises(ValueError):
+        validate_address({"addr:state": "California"})
+    with pytest.raises(ValueError):
+        validate_address({"addr:postcode": "9001"})
+
+
+def test_is_state() -> None:
+    """Test cases for is_state"""
+    assert is_state("CA")
+    assert is_state("PA")
+    assert is_state("PR")  # territories
+    assert is_state("AE")  # military
+    assert is_state("YT")  # Yukon
+    assert not is_state("YK")
+    assert not is_state("ZZ")
+    assert not is_state("ca")
+
+
+def test_is_postcode() -> None:
+    """Test cases for is_postcode"""
+    assert is_postcode("90012")
+    assert is_postcode("90012-4801")
+    assert not is_postcode("9001")
+    assert not is_postcode("90012-480")
+    assert not is_postcode("90012 4801")
+
+
+def test_validate_postcodes() -> None:
+    """Test cases for validate_postcodes"""
+    assert validate_postcodes(["90012", "90012-4801", "9001"]) == [True, True, False]
+    assert validate_postcodes([]) == []
+
+
+def test_osm_dict_round_trip() -> None:
+    """Test that to_osm_dict inverts from_osm_dict"""
+    tags = {
+        "addr:housenumber": "200",
+        "addr:street": "North Spring Street",
+        "addr:state": "CA",
+    }
+    address = from_osm_dict(tags)
+    assert address.addr_state == "CA"
+    assert to_osm_dict(address) == tags
+    with pytest.raises(ValueError):
+        from_osm_dict({"addr:state": "California"})
+
+
+def test_fast_dump() -> None:
+    """Test cases for Address.fast_dump"""
+    address = Address(
+        **{"addr:housenumber": "200", "addr:street": "North Spring Street"}
+    )
+    assert address.fast_dump() == {
+        "addr:housenumber": "200",
+        "addr:street": "North Spring Street",
+        "addr:unit": None,
+        "addr:city": None,
+        "addr:state": None,
+        "addr:postcode": None,
+    }
+
+
+def test_address_json_schema() -> None:
+    """Test cases for address_json_schema"""
+    schema = address_json_schema()
+    assert schema["title"] == "Address"
+    assert "addr:state" in schema["properties"]
+    assert address_json_schema() is schema  # cached
+
+
+def test_address_from_positional() -> None:
+    """Test cases for Address._from_positional"""
+    address = Address._from_positional("200", "North Spring Street", state="CA")
+    assert address.addr_housenumber == "200"
+    assert address.addr_street == "North Spring Street"
+    assert address.addr_state == "CA"
+    with pytest.raises(ValueError):
+        Address._from_positional(state="California")
+
+
+def test_no_per_call_pattern_compilation() -> None:
+    """Test that repeated parsing does not grow the re pattern cache"""
+    import re
+
+    from src.atlus.atlus import _get_address_cached
+
+    samples = [
+        "345 MAPLE RD, COUNTRYSIDE, PA 24680-0198",
+        "222 NW Pineapple Ave Suite A Unit B",
+        "158 S. Thomas Court",
+    ]
+    for sample in samples:  # warm up every lazily compiled pattern
+        get_address(sample)
+    get_phone("(202) 900-9019")
+
+    _get_address_cached.cache_clear()
+    cached_before = len(re._cache)
+    for sample in samples:
+        get_address(sample)
+    get_phone("(202) 900-9019")
+    assert len(re._cache) == cached_before